@@ -6,6 +6,14 @@ from typing import List, Dict, Callable
 from datetime import datetime
 from functools import reduce
 
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson  # SIMD-accelerated JSON, ~3-10x faster than stdlib
+except ImportError:
+    orjson = None
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 TRANSACTIONS_FILE = os.path.join(BASE_DIR, "transactions.json")
 BUDGETS_FILE = os.path.join(BASE_DIR, "budgets.json")
@@ -20,25 +28,27 @@ def ensure_files_exist():
         (BUDGETS_FILE, {}),
         (SAVINGS_FILE, {})
     ]
-    def ensure_rec(index=0):
-        if index >= len(files):
-            return
-        path, default_content = files[index]
+    for path, default_content in files:
         if not os.path.exists(path):
             with open(path, "w") as file:
                 json.dump(default_content, file)
-        ensure_rec(index + 1)
-    ensure_rec()
 
 def load_data(file_path: str) -> List or Dict:
     """Load JSON data from file."""
+    if orjson is not None:
+        with open(file_path, "rb") as file:
+            return orjson.loads(file.read())
     with open(file_path, "r") as file:
         return json.load(file)
 
-def save_data(file_path: str, data: List or Dict):
-    """Save JSON data to file."""
+def save_data(file_path: str, data: List or Dict, pretty: bool = False):
+    """Save JSON data to file, compact by default."""
+    if orjson is not None:
+        with open(file_path, "wb") as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+        return
     with open(file_path, "w") as file:
-        json.dump(data, file, indent=4)
+        json.dump(data, file, indent=4 if pretty else None)
 
 # Functional Helpers
 def filter_transactions(transactions: List[Dict], predicate: Callable[[Dict], bool]) -> List[Dict]:
@@ -50,101 +60,146 @@ def map_transactions(transactions: List[Dict], mapper: Callable[[Dict], float])
 def reduce_transactions(values: List[float], reducer: Callable[[float, float], float], initial: float = 0) -> float:
     return reduce(reducer, values, initial)
 
+def aggregate_expenses(transactions: List[Dict], categories: Dict = None) -> Dict:
+    """Sum expense amounts per category in a single vectorized reduction."""
+    if not transactions:
+        return {}
+    # Filter and column extraction fused into one pass: no intermediate
+    # expense list, no full-length arrays, no boolean-mask copies.
+    if categories is None:
+        rows = [(t["amount"], t["category"]) for t in transactions
+                if t["type"] == "expense"]
+    else:
+        # Most selective test first: few categories carry a budget, so the
+        # set probe short-circuits the type compare on most rows.
+        budget_set = frozenset(categories)
+        rows = [(t["amount"], t["category"]) for t in transactions
+                if t["category"] in budget_set and t["type"] == "expense"]
+    if not rows:
+        return {}
+    amounts, cats = zip(*rows)
+    # Intern category strings into small int codes once, then reduce with
+    # bincount - integer compares instead of repeated string hashing.
+    codes, uniques = pd.factorize(np.asarray(cats))
+    totals = np.bincount(codes, weights=np.asarray(amounts, dtype=np.float64))
+    return {str(category): float(totals[code]) for code, category in enumerate(uniques)}
+
 # Budget Functions
+_SPECIALIZE_MAX_BUDGETS = 8
+_specialized_cache: Dict = {}
+
+def _specialized_totals(budgets: Dict) -> Callable[[List[Dict]], Dict]:
+    """Compile (and cache) an accumulator with the budgeted category names
+    hardcoded as branches, keyed on the budget key set.
+
+    For a handful of stable budgets this replaces the dict probe per row
+    with a short run of string-equality checks and skips the array setup
+    cost of the vectorized path entirely.
+    """
+    key = frozenset(budgets)
+    fn = _specialized_cache.get(key)
+    if fn is None:
+        categories = list(budgets)
+        lines = [
+            "def _totals(transactions):",
+            "    s = [0.0] * %d" % len(categories),
+            "    for t in transactions:",
+            "        if t['type'] != 'expense':",
+            "            continue",
+            "        c = t['category']",
+        ]
+        for i, category in enumerate(categories):
+            lines.append("        if c == %r: s[%d] += t['amount']" % (category, i))
+        lines.append("    return s")
+        namespace = {}
+        exec(compile("\n".join(lines), "<specialized>", "exec"), namespace)
+        slot_totals = namespace["_totals"]
+
+        def fn(transactions, _slot_totals=slot_totals, _categories=categories):
+            sums = _slot_totals(transactions)
+            return {category: total for category, total in zip(_categories, sums) if total}
+
+        _specialized_cache[key] = fn
+    return fn
+
 def calculate_budget_utilization(transactions: List[Dict], budgets: Dict) -> Dict:
-    expenses = filter_transactions(transactions, lambda t: t["type"] == "expense")
-    def calculate_utilization(expenses_list, utilization=None):
-        if utilization is None:
-            utilization = {}
-        if not expenses_list:
-            return utilization
-        txn = expenses_list[0]
-        category = txn["category"]
-        if category in budgets:
-            utilization[category] = utilization.get(category, 0) + txn["amount"]
-        return calculate_utilization(expenses_list[1:], utilization)
-
-    return calculate_utilization(expenses)
+    if 0 < len(budgets) <= _SPECIALIZE_MAX_BUDGETS:
+        return _specialized_totals(budgets)(transactions)
+    return aggregate_expenses(transactions, categories=budgets)
 
 def check_budget_alerts(transactions: List[Dict], budgets: Dict):
     utilization = calculate_budget_utilization(transactions, budgets)
-    def check_alerts(alert_list):
-        if not alert_list:
-            return
-        category, spent = alert_list[0]
-        if spent / budgets[category] >= ALERT_THRESHOLD:
-            print(f"\n⚠️ ALERT: '{category}' is at {spent / budgets[category]:.0%} of the budget! Spent: {spent}, Limit: {budgets[category]}")
-        check_alerts(alert_list[1:])
-
-    check_alerts(list(utilization.items()))
+    if not utilization:
+        return
+    categories = list(utilization)
+    spent = np.asarray([utilization[c] for c in categories], dtype=np.float64)
+    limits = np.asarray([budgets[c] for c in categories], dtype=np.float64)
+    ratios = spent / limits
+    for index in np.flatnonzero(ratios >= ALERT_THRESHOLD):
+        category = categories[index]
+        print(f"\n⚠️ ALERT: '{category}' is at {ratios[index]:.0%} of the budget! Spent: {utilization[category]}, Limit: {budgets[category]}")
 
 # Summarize Spending
 def summarize_spending(transactions: List[Dict]):
-    expenses = filter_transactions(transactions, lambda t: t["type"] == "expense")
-    def calculate_totals(expenses_list, totals=None):
-        if totals is None:
-            totals = {}
-        if not expenses_list:
-            return totals
-        txn = expenses_list[0]
-        totals[txn["category"]] = totals.get(txn["category"], 0) + txn["amount"]
-        return calculate_totals(expenses_list[1:], totals)
-
-    category_totals = calculate_totals(expenses)
+    category_totals = aggregate_expenses(transactions)
     total_spent = sum(category_totals.values())
 
     print("\nSpending Summary:")
-    def print_summary(categories):
-        if not categories:
-            return
-        category, amount = categories[0]
+    for category, amount in category_totals.items():
         print(f"  - {category}: ${amount:.2f}")
-        print_summary(categories[1:])
-
-    print_summary(list(category_totals.items()))
     print(f"Total Spending: ${total_spent:.2f}")
 
 # Savings Functions
 def set_savings_goal():
     savings = load_data(SAVINGS_FILE)
     goal = float(input("Enter savings goal amount: "))
-    savings = {**savings, "goal": goal, "recommended_monthly": goal / 12, "current_savings": savings.get("current_savings", 0)}
+    savings.update(goal=goal, recommended_monthly=goal / 12)
+    savings.setdefault("current_savings", 0)
     save_data(SAVINGS_FILE, savings)
     print(f"Savings goal of ${goal:.2f} set. You should save ${goal / 12:.2f} per month.")
 
 def update_savings(amount: float):
     savings = load_data(SAVINGS_FILE)
     current_savings = savings.get("current_savings", 0) + amount
-    savings = {**savings, "current_savings": current_savings}
+    savings["current_savings"] = current_savings
     save_data(SAVINGS_FILE, savings)
     print(f"${amount:.2f} added to savings. Current savings: ${current_savings:.2f}")
     if current_savings >= savings["goal"]:
         print("🎉 Congratulations! You've achieved your savings goal!")
 
 # Import and Export
-def import_transactions(file_path: str):
-    transactions = load_data(TRANSACTIONS_FILE)
-    with open(file_path, "r") as file:
-        reader = csv.DictReader(file)
+def import_transactions(file_path: str, transactions: List[Dict] = None):
+    if transactions is None:
+        transactions = load_data(TRANSACTIONS_FILE)
+    with open(file_path, "r", newline="") as file:
+        reader = csv.reader(file)
+        header = next(reader)
+        # Positional indexing avoids DictReader's per-row dict build
+        ai, ci, ti, di = (header.index(k) for k in ("amount", "category", "type", "date"))
         new_transactions = [{
-            "amount": float(row["amount"]),
-            "category": row["category"],
-            "type": row["type"],
-            "date": row["date"]
+            "amount": float(row[ai]),
+            "category": row[ci],
+            "type": row[ti],
+            "date": row[di]
         } for row in reader]
-    save_data(TRANSACTIONS_FILE, transactions + new_transactions)
+    transactions.extend(new_transactions)
+    save_data(TRANSACTIONS_FILE, transactions)
     print(f"Transactions imported successfully from {file_path}.")
 
 def export_transactions():
     transactions = load_data(TRANSACTIONS_FILE)
     export_file = os.path.join(BASE_DIR, "transactions_export.json")
-    save_data(export_file, transactions)
+    save_data(export_file, transactions, pretty=True)
     print(f"Transactions exported to {export_file}.")
 
 # Menu System
 def menu_loop():
     ensure_files_exist()
-    def loop():
+    # Load once at startup; every mutation below updates these in place
+    # and saves, so no per-iteration reload is needed.
+    transactions = load_data(TRANSACTIONS_FILE)
+    budgets = load_data(BUDGETS_FILE)
+    while True:
         print("\n--- Budget Tracker ---")
         print("1. Record a transaction")
         print("2. Set a budget")
@@ -157,9 +212,7 @@ def menu_loop():
         print("9. Exit")
 
         choice = input("Enter your choice: ")
-        transactions = load_data(TRANSACTIONS_FILE)
-        budgets = load_data(BUDGETS_FILE)
-        
+
         if choice == "1":
             txn = {
                 "amount": float(input("Enter amount: ")),
@@ -167,11 +220,12 @@ def menu_loop():
                 "type": input("Enter type (income/expense): "),
                 "date": input("Enter date (YYYY-MM-DD): ") or datetime.now().strftime('%Y-%m-%d')
             }
-            save_data(TRANSACTIONS_FILE, transactions + [txn])
+            transactions.append(txn)
+            save_data(TRANSACTIONS_FILE, transactions)
             print("Transaction recorded successfully.")
-            check_budget_alerts(transactions + [txn], budgets)
+            check_budget_alerts(transactions, budgets)
         elif choice == "2":
-            budgets = {**budgets, input("Enter category: "): float(input("Enter amount: "))}
+            budgets[input("Enter category: ")] = float(input("Enter amount: "))
             save_data(BUDGETS_FILE, budgets)
             print("Budget updated.")
         elif choice == "3":
@@ -183,7 +237,7 @@ def menu_loop():
         elif choice == "6":
             update_savings(float(input("Enter savings amount: ")))
         elif choice == "7":
-            import_transactions(input("Enter CSV file path: "))
+            import_transactions(input("Enter CSV file path: "), transactions)
         elif choice == "8":
             export_transactions()
         elif choice == "9":
@@ -191,8 +245,6 @@ def menu_loop():
             return
         else:
             print("Invalid choice, please try again.")
-        loop()
-    loop()
 
 if __name__ == "__main__":
     menu_loop()
@@ -1,12 +1,232 @@
 import json
+import mmap
 import os
 import csv
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson  # SIMD-accelerated JSON, ~3-10x faster than stdlib
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import ijson  # streaming JSON parser for large transaction files
+except ImportError:
+    ijson = None
+
+# Errors that mean "transactions file is missing or not valid JSON"
+_LOAD_ERRORS = (FileNotFoundError, json.JSONDecodeError)
+if ijson is not None:
+    _LOAD_ERRORS += (ijson.JSONError,)
+
+def _expense_kernel(amounts, cat_codes, type_codes, n_categories):
+    """Accumulate expense totals and row counts per category code."""
+    totals = np.zeros(n_categories)
+    counts = np.zeros(n_categories, dtype=np.int64)
+    for i in range(amounts.size):
+        if type_codes[i] == 1:
+            code = cat_codes[i]
+            totals[code] += amounts[i]
+            counts[code] += 1
+    return totals, counts
+
+if njit is not None:
+    # LLVM-compiled native loop over the contiguous columns
+    _expense_kernel = njit(cache=True)(_expense_kernel)
+else:
+    def _expense_kernel(amounts, cat_codes, type_codes, n_categories):
+        """NumPy fallback for the aggregation kernel when Numba is absent."""
+        mask = type_codes == 1
+        codes = cat_codes[mask]
+        totals = np.bincount(codes, weights=amounts[mask], minlength=n_categories)
+        counts = np.bincount(codes, minlength=n_categories)
+        return totals, counts
+
+def read_json(path):
+    """Load JSON from a file, preferring orjson when available."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def write_json(path, data, pretty=False):
+    """Write JSON to a file (compact by default), preferring orjson."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+        return
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=4 if pretty else None)
+
+class TransactionStore:
+    """Struct-of-arrays transaction storage.
+
+    Transactions live in parallel NumPy columns (amount, category code,
+    type code, date) instead of a list of per-row dicts, so analytics
+    run as contiguous array reductions. Categories are interned into a
+    vocabulary of small integer codes; type codes are 0=income, 1=expense.
+    Columns share one preallocated capacity that doubles on overflow so
+    appends stay amortized O(1).
+    """
+
+    INITIAL_CAPACITY = 16
+
+    def __init__(self):
+        self.category_vocab = {}
+        self.categories = []  # code -> name, inverse of category_vocab
+        self._capacity = self.INITIAL_CAPACITY
+        self._size = 0
+        self._amounts = np.empty(self._capacity, dtype=np.float64)
+        self._cat_codes = np.empty(self._capacity, dtype=np.int32)
+        self._type_codes = np.empty(self._capacity, dtype=np.int8)
+        self._dates = np.empty(self._capacity, dtype='datetime64[D]')
+        self._date_strs = []  # raw date strings, kept for lossless round-trips
+        self._type_strs = []  # raw type strings, ditto
+        self._by_date = None  # lazily built date-sorted (dates, amounts, type_codes)
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def amounts(self):
+        return self._amounts[:self._size]
+
+    @property
+    def cat_codes(self):
+        return self._cat_codes[:self._size]
+
+    @property
+    def type_codes(self):
+        return self._type_codes[:self._size]
+
+    @property
+    def dates(self):
+        return self._dates[:self._size]
+
+    def category_code(self, category):
+        """Return the integer code for a category, interning it if new."""
+        code = self.category_vocab.get(category)
+        if code is None:
+            code = len(self.categories)
+            self.category_vocab[category] = code
+            self.categories.append(category)
+        return code
+
+    def _grow(self):
+        self._capacity *= 2
+        self._amounts = np.resize(self._amounts, self._capacity)
+        self._cat_codes = np.resize(self._cat_codes, self._capacity)
+        self._type_codes = np.resize(self._type_codes, self._capacity)
+        self._dates = np.resize(self._dates, self._capacity)
+
+    def append(self, amount, category, type, date):
+        if self._size == self._capacity:
+            self._grow()
+        index = self._size
+        self._amounts[index] = amount
+        self._cat_codes[index] = self.category_code(category)
+        self._type_codes[index] = 1 if type == 'expense' else 0
+        self._type_strs.append(type)
+        self._date_strs.append(date)
+        try:
+            self._dates[index] = np.datetime64(date, 'D')
+        except ValueError:
+            # Non-ISO date: keep the raw string, exclude it from date math
+            self._dates[index] = np.datetime64('NaT')
+        self._size += 1
+        self._by_date = None
+
+    @classmethod
+    def from_records(cls, records):
+        """Build a store from a list of transaction dicts in one shot."""
+        store = cls()
+        if not records:
+            return store
+        frame = pd.DataFrame(records)
+        cat_codes, categories = pd.factorize(frame['category'])
+        store.category_vocab = {name: code for code, name in enumerate(categories)}
+        store.categories = list(categories)
+        store._size = len(frame)
+        store._capacity = max(store._size, cls.INITIAL_CAPACITY)
+        store._amounts = np.resize(frame['amount'].to_numpy(dtype=np.float64), store._capacity)
+        store._cat_codes = np.resize(cat_codes.astype(np.int32), store._capacity)
+        store._type_codes = np.resize((frame['type'].to_numpy() == 'expense').astype(np.int8), store._capacity)
+        store._type_strs = list(frame['type'])
+        store._date_strs = list(frame['date'])
+        # Per-row parse: unparsable dates become NaT instead of failing
+        # the whole load
+        dates = pd.to_datetime(frame['date'], errors='coerce').to_numpy().astype('datetime64[D]')
+        store._dates = np.resize(dates, store._capacity)
+        return store
+
+    @classmethod
+    def from_stream(cls, path):
+        """Stream a JSON transactions file straight into the columns.
+
+        Memory-maps the file and parses lazily, so rows land in the
+        arrays one at a time instead of first materializing the whole
+        file as a list of dicts.
+        """
+        store = cls()
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return store
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                for txn in ijson.items(buf, 'item', use_float=True):
+                    store.append(txn['amount'], txn['category'], txn['type'], txn['date'])
+        return store
+
+    def to_records(self):
+        """Convert back to the list-of-dicts shape used in the JSON files."""
+        return [{
+            'amount': float(self._amounts[i]),
+            'category': self.categories[self._cat_codes[i]],
+            'type': self._type_strs[i],
+            'date': self._date_strs[i]
+        } for i in range(self._size)]
+
+    def month_expense_total(self, year, month):
+        """Total expenses in one calendar month via a searchsorted window.
+
+        Columns are sorted by date once (and cached until the next
+        append), so each query is a log-N seek for the month bounds plus
+        one contiguous reduction over the rows inside the window.
+        """
+        if self._by_date is None:
+            order = np.argsort(self.dates, kind='stable')
+            self._by_date = (self.dates[order], self.amounts[order], self.type_codes[order])
+        dates, amounts, type_codes = self._by_date
+        start = np.datetime64('%04d-%02d' % (year, month))
+        lo = np.searchsorted(dates, start.astype('datetime64[D]'))
+        hi = np.searchsorted(dates, (start + 1).astype('datetime64[D]'))
+        return float(amounts[lo:hi][type_codes[lo:hi] == 1].sum())
+
+    def expense_totals(self, categories=None):
+        """Sum expense amounts per category in one compiled kernel pass."""
+        totals, counts = _expense_kernel(
+            self.amounts, self.cat_codes, self.type_codes, len(self.categories))
+        if categories is None:
+            wanted = None
+        else:
+            # Resolve the wanted categories to interned codes once
+            wanted = {self.category_vocab[c] for c in categories if c in self.category_vocab}
+        return {self.categories[code]: float(totals[code])
+                for code in np.flatnonzero(counts)
+                if wanted is None or code in wanted}
+
 class BudgetTracker:
     def __init__(self):
         # Mutable global state
-        self.transactions = []
+        self.transactions = TransactionStore()
         self.budgets = {}
         self.savings = {
             'goal': 0,
@@ -21,23 +241,26 @@ class BudgetTracker:
         self.SAVINGS_FILE = os.path.join(self.BASE_DIR, "savings.json")
         self.ALERT_THRESHOLD = 0.9  # 90% of the budget
 
+        # Tracks which state files have unsaved mutations
+        self._dirty = {'transactions': False, 'budgets': False, 'savings': False}
+
     def load_state(self):
         """Load mutable state from files."""
         try:
-            with open(self.TRANSACTIONS_FILE, 'r') as f:
-                self.transactions = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.transactions = []
+            if ijson is not None:
+                self.transactions = TransactionStore.from_stream(self.TRANSACTIONS_FILE)
+            else:
+                self.transactions = TransactionStore.from_records(read_json(self.TRANSACTIONS_FILE))
+        except _LOAD_ERRORS:
+            self.transactions = TransactionStore()
 
         try:
-            with open(self.BUDGETS_FILE, 'r') as f:
-                self.budgets = json.load(f)
+            self.budgets = read_json(self.BUDGETS_FILE)
         except (FileNotFoundError, json.JSONDecodeError):
             self.budgets = {}
 
         try:
-            with open(self.SAVINGS_FILE, 'r') as f:
-                self.savings = json.load(f)
+            self.savings = read_json(self.SAVINGS_FILE)
         except (FileNotFoundError, json.JSONDecodeError):
             self.savings = {
                 'goal': 0,
@@ -45,67 +268,63 @@ class BudgetTracker:
                 'recommended_monthly': 0
             }
 
-    def save_state(self):
-        """Save current mutable state to files."""
-        with open(self.TRANSACTIONS_FILE, 'w') as f:
-            json.dump(self.transactions, f, indent=4)
-
-        with open(self.BUDGETS_FILE, 'w') as f:
-            json.dump(self.budgets, f, indent=4)
-
-        with open(self.SAVINGS_FILE, 'w') as f:
-            json.dump(self.savings, f, indent=4)
+    def save_state(self, force=False):
+        """Save mutated state to files; unless forced, unchanged files are skipped."""
+        if force or self._dirty['transactions']:
+            write_json(self.TRANSACTIONS_FILE, self.transactions.to_records())
+            self._dirty['transactions'] = False
+        if force or self._dirty['budgets']:
+            write_json(self.BUDGETS_FILE, self.budgets)
+            self._dirty['budgets'] = False
+        if force or self._dirty['savings']:
+            write_json(self.SAVINGS_FILE, self.savings)
+            self._dirty['savings'] = False
 
     def record_transaction(self, amount, category, type, date=None):
         """Add a transaction with side effects."""
-        transaction = {
-            'amount': amount,
-            'category': category,
-            'type': type,
-            'date': date or datetime.now().strftime('%Y-%m-%d')
-        }
-        self.transactions.append(transaction)
+        self.transactions.append(
+            amount=amount,
+            category=category,
+            type=type,
+            date=date or datetime.now().strftime('%Y-%m-%d')
+        )
+        self._dirty['transactions'] = True
         self.save_state()
         self.check_budget_alerts()
 
     def set_budget(self, category, amount):
         """Set a budget with side effects."""
         self.budgets[category] = amount
+        self._dirty['budgets'] = True
         self.save_state()
         print(f"Budget for {category} set to ${amount}")
 
+    def _expense_totals(self, categories=None):
+        """Sum expense amounts per category in one vectorized reduction."""
+        if not len(self.transactions):
+            return {}
+        return self.transactions.expense_totals(categories)
+
     def check_budget_alerts(self):
         """Check budget alerts with side effects."""
-        category_spending = {}
-        
-        # Mutate spending tracker
-        for transaction in self.transactions:
-            if transaction['type'] == 'expense':
-                category = transaction['category']
-                if category not in category_spending:
-                    category_spending[category] = 0
-                category_spending[category] += transaction['amount']
-        
+        category_spending = self._expense_totals(categories=self.budgets)
+        if not category_spending:
+            return
+
+        # Vectorized utilization check across all budgeted categories
+        categories = list(category_spending)
+        spent = np.asarray([category_spending[c] for c in categories], dtype=np.float64)
+        limits = np.asarray([self.budgets[c] for c in categories], dtype=np.float64)
+        utilization = spent / limits
+
         # Side effect: print alerts
-        for category, spent in category_spending.items():
-            if category in self.budgets:
-                utilization = spent / self.budgets[category]
-                if utilization >= self.ALERT_THRESHOLD:
-                    print(f"⚠️ ALERT: '{category}' is at {utilization:.0%} of budget!")
+        for index in np.flatnonzero(utilization >= self.ALERT_THRESHOLD):
+            print(f"⚠️ ALERT: '{categories[index]}' is at {utilization[index]:.0%} of budget!")
 
     def summarize_spending(self):
         """Generate spending summary with side effects."""
-        category_totals = {}
-        total_spending = 0
-
-        # Mutate totals
-        for transaction in self.transactions:
-            if transaction['type'] == 'expense':
-                category = transaction['category']
-                if category not in category_totals:
-                    category_totals[category] = 0
-                category_totals[category] += transaction['amount']
-                total_spending += transaction['amount']
+        category_totals = self._expense_totals()
+        total_spending = sum(category_totals.values())
 
         # Side effect: print summary
         print("\nSpending Summary:")
@@ -113,16 +332,36 @@ class BudgetTracker:
             print(f"  - {category}: ${amount:.2f}")
         print(f"Total Spending: ${total_spending:.2f}")
 
+    def analyze_trends(self):
+        """Compare this month's spending to last month's with side effects."""
+        now = datetime.now()
+        if now.month == 1:
+            previous_year, previous_month = now.year - 1, 12
+        else:
+            previous_year, previous_month = now.year, now.month - 1
+
+        current = self.transactions.month_expense_total(now.year, now.month)
+        previous = self.transactions.month_expense_total(previous_year, previous_month)
+
+        # Side effect: print trend report
+        print("\nSpending Trends:")
+        print(f"  This month: ${current:.2f}")
+        print(f"  Last month: ${previous:.2f}")
+        if previous:
+            print(f"  Change: {(current - previous) / previous:+.0%}")
+
     def set_savings_goal(self, goal):
         """Set savings goal with side effects."""
         self.savings['goal'] = goal
         self.savings['recommended_monthly'] = goal / 12
+        self._dirty['savings'] = True
         self.save_state()
         print(f"Savings goal set to ${goal}. Recommended monthly savings: ${goal/12:.2f}")
 
     def update_savings(self, amount):
         """Update savings with side effects."""
         self.savings['current_savings'] += amount
+        self._dirty['savings'] = True
         self.save_state()
 
         print(f"Added ${amount} to savings.")
@@ -134,15 +373,22 @@ class BudgetTracker:
 
     def import_transactions(self, file_path):
         """Import transactions with side effects."""
-        with open(file_path, 'r') as csvfile:
-            reader = csv.DictReader(csvfile)
+        with open(file_path, 'r', newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader)
+            # Positional indexing avoids DictReader's per-row dict build
+            ai, ci, ti, di = (header.index(k) for k in ('amount', 'category', 'type', 'date'))
             for row in reader:
-                self.record_transaction(
-                    amount=float(row['amount']),
-                    category=row['category'],
-                    type=row['type'],
-                    date=row['date']
+                self.transactions.append(
+                    amount=float(row[ai]),
+                    category=row[ci],
+                    type=row[ti],
+                    date=row[di]
                 )
+        # One batched save and one alert scan instead of per-row ones
+        self._dirty['transactions'] = True
+        self.save_state()
+        self.check_budget_alerts()
         print(f"Imported transactions from {file_path}")
 
     def run(self):
@@ -159,7 +405,8 @@ class BudgetTracker:
             print("6. Update savings progress")
             print("7. Import transactions (CSV)")
             print("8. Export transactions")
-            print("9. Exit")
+            print("9. View spending trends")
+            print("10. Exit")
             choice = input("Choose an option: ")
 
             try:
@@ -193,10 +440,13 @@ class BudgetTracker:
                     self.import_transactions(file_path)
                 elif choice == '8':
                     print("Exporting transactions...")
-                    self.save_state()
+                    self.save_state(force=True)
                     print("Transactions exported.")
                     
                 elif choice == '9':
+                    self.analyze_trends()
+
+                elif choice == '10':
                     print("Exiting...")
                     break
                 